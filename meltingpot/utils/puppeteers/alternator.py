@@ -39,9 +39,10 @@ class Alternator(puppeteer.Puppeteer[int]):
       raise ValueError('steps_per_goal must be positive.')
 
     if goals:
-      self._goals = list(goals)
+      self._goals = tuple(goals)
     else:
       raise ValueError('goals must not be empty.')
+    self._num_goals = len(self._goals)
 
   def initial_state(self) -> int:
     """See base class."""
@@ -53,6 +54,6 @@ class Alternator(puppeteer.Puppeteer[int]):
     if timestep.first():
       prev_state = self.initial_state()
     step_count = prev_state
-    goal_index = step_count // self._steps_per_goal % len(self._goals)
+    goal_index = step_count // self._steps_per_goal % self._num_goals
     timestep = puppeteer.puppet_timestep(timestep, self._goals[goal_index])
     return timestep, step_count + 1
@@ -14,12 +14,13 @@
 """Puppeteers for clean_up."""
 
 import dataclasses
+import operator
 
 import dm_env
 from meltingpot.utils.puppeteers import puppeteer
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ConditionalCleanerState:
   """Current state of the ConditionalCleaner.
 
@@ -28,10 +29,13 @@ class ConditionalCleanerState:
     clean_until: step_count after which to stop cleaning.
     recent_cleaning: number of others cleaning on previous timesteps (ordered
       from oldest to most recent).
+    recent_cleaning_total: running total of recent_cleaning, updated
+      incrementally as the window slides.
   """
   step_count: int
   clean_until: int
   recent_cleaning: tuple[int, ...]
+  recent_cleaning_total: int
 
 
 class ConditionalCleaner(puppeteer.Puppeteer[ConditionalCleanerState]):
@@ -79,7 +83,7 @@ class ConditionalCleaner(puppeteer.Puppeteer[ConditionalCleanerState]):
     """
     self._clean_goal = clean_goal
     self._eat_goal = eat_goal
-    self._coplayer_cleaning_signal = coplayer_cleaning_signal
+    self._get_coplayer_cleaning = operator.itemgetter(coplayer_cleaning_signal)
 
     if threshold > 0:
       self._threshold = threshold
@@ -104,7 +108,10 @@ class ConditionalCleaner(puppeteer.Puppeteer[ConditionalCleanerState]):
   def initial_state(self) -> ConditionalCleanerState:
     """See base class."""
     return ConditionalCleanerState(
-        step_count=0, clean_until=self._niceness_period, recent_cleaning=())
+        step_count=0,
+        clean_until=self._niceness_period,
+        recent_cleaning=(),
+        recent_cleaning_total=0)
 
   def step(
       self, timestep: dm_env.TimeStep, prev_state: ConditionalCleanerState
@@ -115,13 +122,15 @@ class ConditionalCleaner(puppeteer.Puppeteer[ConditionalCleanerState]):
     step_count = prev_state.step_count
     clean_until = prev_state.clean_until
     recent_cleaning = prev_state.recent_cleaning
+    smooth_cleaning = prev_state.recent_cleaning_total
 
-    coplayers_cleaning = int(
-        timestep.observation[self._coplayer_cleaning_signal])
+    coplayers_cleaning = int(self._get_coplayer_cleaning(timestep.observation))
     recent_cleaning += (coplayers_cleaning,)
-    recent_cleaning = recent_cleaning[-self._recency_window:]
+    smooth_cleaning += coplayers_cleaning
+    if len(recent_cleaning) > self._recency_window:
+      smooth_cleaning -= recent_cleaning[0]
+      recent_cleaning = recent_cleaning[1:]
 
-    smooth_cleaning = sum(recent_cleaning)
     if smooth_cleaning >= self._threshold:
       clean_until = max(clean_until, step_count + self._reciprocation_period)
       # Do not clear the recent_cleaning history after triggering.
@@ -136,5 +145,6 @@ class ConditionalCleaner(puppeteer.Puppeteer[ConditionalCleanerState]):
     next_state = ConditionalCleanerState(
         step_count=step_count + 1,
         clean_until=clean_until,
-        recent_cleaning=recent_cleaning)
+        recent_cleaning=recent_cleaning,
+        recent_cleaning_total=smooth_cleaning)
     return timestep, next_state
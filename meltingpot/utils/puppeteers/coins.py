@@ -19,7 +19,7 @@ import dm_env
 from meltingpot.utils.puppeteers import puppeteer
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ReciprocatorState:
   """Current state of the Reciprocator.
 
@@ -29,11 +29,14 @@ class ReciprocatorState:
     defect_until: earliest step_count after which to stop defecting.
     recent_defection: level of defection on previous timesteps (ordered from
       oldest to most recent).
+    recent_defection_total: running total of recent_defection, updated
+      incrementally as the window slides.
   """
   step_count: int
   spite_until: int
   defect_until: int
   recent_defection: tuple[int, ...]
+  recent_defection_total: int
 
 
 class Reciprocator(puppeteer.Puppeteer[ReciprocatorState]):
@@ -112,7 +115,11 @@ class Reciprocator(puppeteer.Puppeteer[ReciprocatorState]):
   def initial_state(self) -> ReciprocatorState:
     """See base class."""
     return ReciprocatorState(
-        step_count=0, spite_until=0, defect_until=0, recent_defection=())
+        step_count=0,
+        spite_until=0,
+        defect_until=0,
+        recent_defection=(),
+        recent_defection_total=0)
 
   def step(
       self, timestep: dm_env.TimeStep, prev_state: ReciprocatorState
@@ -124,17 +131,21 @@ class Reciprocator(puppeteer.Puppeteer[ReciprocatorState]):
     spite_until = prev_state.spite_until
     defect_until = prev_state.defect_until
     recent_defection = prev_state.recent_defection
+    total_recent_defection = prev_state.recent_defection_total
 
     partner_defection = int(
         timestep.observation[self._partner_defection_signal])
     recent_defection += (partner_defection,)
-    recent_defection = recent_defection[-self._recency_window:]
+    total_recent_defection += partner_defection
+    if len(recent_defection) > self._recency_window:
+      total_recent_defection -= recent_defection[0]
+      recent_defection = recent_defection[1:]
 
-    total_recent_defection = sum(recent_defection)
     if total_recent_defection >= self._threshold:
       spite_until = step_count + self._spiteful_punishment_window
       defect_until = step_count + self._frames_to_punish
       recent_defection = ()
+      total_recent_defection = 0
 
     if step_count < spite_until:
       goal = self._spite_goal
@@ -148,5 +159,6 @@ class Reciprocator(puppeteer.Puppeteer[ReciprocatorState]):
         step_count=step_count + 1,
         spite_until=spite_until,
         defect_until=defect_until,
-        recent_defection=recent_defection)
+        recent_defection=recent_defection,
+        recent_defection_total=total_recent_defection)
     return timestep, next_state
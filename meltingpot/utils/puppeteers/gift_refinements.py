@@ -13,14 +13,9 @@
 # limitations under the License.
 """Puppeteers for gift_refinements."""
 
-from collections.abc import Mapping
-
 import dm_env
 from meltingpot.utils.puppeteers import puppeteer
 import numpy as np
-import tree
-
-Observation = Mapping[str, tree.Structure[np.ndarray]]
 
 
 class GiftRefinementsCooperator(puppeteer.Puppeteer[tuple[()]]):
@@ -59,16 +54,17 @@ class GiftRefinementsCooperator(puppeteer.Puppeteer[tuple[()]]):
     """See base class."""
     return ()
 
-  def should_consume(self, observation: Observation) -> bool:
+  def should_consume(self, inventory: np.ndarray) -> bool:
     """Decides whether we should consume tokens in our inventory."""
-    _, refined, twice_refined = observation['INVENTORY']
+    _, refined, twice_refined = inventory
     return bool(refined) or bool(twice_refined)
 
   def step(self, timestep: dm_env.TimeStep,
            prev_state: tuple[()]) -> tuple[dm_env.TimeStep, tuple[()]]:
     """See base class."""
-    if np.sum(timestep.observation['INVENTORY']):
-      if self.should_consume(timestep.observation):
+    inventory = timestep.observation['INVENTORY']
+    if np.sum(inventory):
+      if self.should_consume(inventory):
         goal = self._consume_goal
       else:
         goal = self._gift_goal
@@ -89,7 +85,7 @@ class GiftRefinementsExtremeCooperator(GiftRefinementsCooperator):
   refined token.
   """
 
-  def should_consume(self, observation: Observation) -> bool:
+  def should_consume(self, inventory: np.ndarray) -> bool:
     """See base class."""
-    _, _, twice_refined = observation['INVENTORY']
+    _, _, twice_refined = inventory
     return bool(twice_refined > 0)
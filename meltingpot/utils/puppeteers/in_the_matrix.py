@@ -36,7 +36,7 @@ def get_partner_interaction_inventory(
     timestep: dm_env.TimeStep) -> Optional[np.ndarray]:
   """Returns the partner inventory from previous interaction."""
   _, partner_inventory = timestep.observation["INTERACTION_INVENTORIES"]
-  if np.all(partner_inventory < 0):
+  if partner_inventory.max() < 0:
     return None  # No interaction occurred.
   else:
     return partner_inventory
@@ -49,11 +49,9 @@ def has_interaction(timestep: dm_env.TimeStep) -> bool:
 
 def max_resource_and_margin(inventory: np.ndarray) -> tuple[int, int]:
   """Returns the index of the maximum resource and the margin of its lead."""
-  sorted_resources = np.argsort(inventory)
-  maximum_resource = sorted_resources[-1]
-  margin = (
-      int(inventory[sorted_resources[-1]]) -
-      int(inventory[sorted_resources[-2]]))
+  maximum_resource = int(np.argmax(inventory))
+  runner_up = np.partition(inventory, -2)[-2]
+  margin = int(inventory[maximum_resource]) - int(runner_up)
   return maximum_resource, margin
 
 
@@ -328,6 +326,7 @@ class GrimTrigger(puppeteer.Puppeteer[int]):
 
     self._cooperate_resource = cooperate_resource
     self._defect_resource = defect_resource
+    self._defect_index = defect_resource.index
 
     if margin > 0:
       self._margin = margin
@@ -345,7 +344,7 @@ class GrimTrigger(puppeteer.Puppeteer[int]):
       prev_state = self.initial_state()
 
     partner_resource = partner_max_resource(timestep)
-    partner_defected = partner_resource == self._defect_resource.index
+    partner_defected = partner_resource == self._defect_index
     if partner_defected:
       partner_defections = prev_state + 1
     else:
@@ -359,6 +358,38 @@ class GrimTrigger(puppeteer.Puppeteer[int]):
           timestep, self._defect_resource, self._margin)
     return timestep, partner_defections
 
+  @classmethod
+  def batched_step(
+      cls,
+      partner_defections: np.ndarray,
+      partner_resources: np.ndarray,
+      defect_index: int,
+      threshold: int,
+  ) -> tuple[np.ndarray, np.ndarray]:
+    """Advances a population of grim trigger states in one vectorized call.
+
+    Callers that manage many GrimTrigger puppeteers in parallel can use this
+    to replace N Python `step` calls with a handful of NumPy operations. Goal
+    emission (collect versus interact) still happens per puppet from its own
+    timestep.
+
+    Args:
+      partner_defections: [N] counts of defections endured by each puppeteer.
+      partner_resources: [N] partner's maximum resource at the last
+        interaction for each puppeteer, with -1 wherever there was no
+        interaction (the batched equivalent of partner_max_resource returning
+        None).
+      defect_index: index of the defection resource.
+      threshold: number of defections after which a puppeteer triggers.
+
+    Returns:
+      partner_defections: [N] updated defection counts.
+      triggered: [N] bools, True where the puppeteer should now defect.
+    """
+    partner_defections = partner_defections + (
+        partner_resources == defect_index)
+    return partner_defections, partner_defections >= threshold
+
 
 class TitForTat(puppeteer.Puppeteer[bool]):
   """Puppeteer for a tit-for-tat bot.
@@ -392,6 +423,8 @@ class TitForTat(puppeteer.Puppeteer[bool]):
     """
     self._cooperate_resource = cooperate_resource
     self._defect_resource = defect_resource
+    self._cooperate_index = cooperate_resource.index
+    self._defect_index = defect_resource.index
 
     if margin > 0:
       self._margin = margin
@@ -415,8 +448,8 @@ class TitForTat(puppeteer.Puppeteer[bool]):
       prev_state = self.initial_state()
 
     partner_resource = partner_max_resource(timestep)
-    partner_defected = partner_resource == self._defect_resource.index
-    partner_cooperated = partner_resource == self._cooperate_resource.index
+    partner_defected = partner_resource == self._defect_index
+    partner_cooperated = partner_resource == self._cooperate_index
 
     if partner_cooperated:
       is_cooperative = True if not tremble(self._tremble_probability) else False
@@ -434,7 +467,7 @@ class TitForTat(puppeteer.Puppeteer[bool]):
     return timestep, is_cooperative
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class CorrigableState:
   """State of Corrigable puppeteer.
 
@@ -482,6 +515,8 @@ class Corrigible(puppeteer.Puppeteer[CorrigableState]):
 
     self._cooperate_resource = cooperate_resource
     self._defect_resource = defect_resource
+    self._cooperate_index = cooperate_resource.index
+    self._defect_index = defect_resource.index
 
     if margin > 0:
       self._margin = margin
@@ -507,8 +542,8 @@ class Corrigible(puppeteer.Puppeteer[CorrigableState]):
       prev_state = self.initial_state()
 
     partner_resource = partner_max_resource(timestep)
-    partner_defected = partner_resource == self._defect_resource.index
-    partner_cooperated = partner_resource == self._cooperate_resource.index
+    partner_defected = partner_resource == self._defect_index
+    partner_cooperated = partner_resource == self._cooperate_index
 
     if partner_defected:
       partner_defections = prev_state.partner_defections + 1
@@ -565,6 +600,7 @@ class RespondToPrevious(puppeteer.Puppeteer[Resource]):
     self._responses = {
         resource.index: response for resource, response in responses.items()
     }
+    self._response_options = tuple(self._responses.values())
     if margin > 0:
       self._margin = margin
     else:
@@ -572,7 +608,7 @@ class RespondToPrevious(puppeteer.Puppeteer[Resource]):
 
   def initial_state(self) -> Resource:
     """See base class."""
-    return random.choice(list(self._responses.values()))
+    return random.choice(self._response_options)
 
   def step(
       self,
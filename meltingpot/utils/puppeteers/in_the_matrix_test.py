@@ -252,6 +252,14 @@ class GrimTriggerTest(parameterized.TestCase):
                                          state)
     self.assertEqual(actual, expected)
 
+  def test_batched_step(self):
+    partner_defections = np.array([0, 1, 1, 2])
+    partner_resources = np.array([0, 0, 1, -1])
+    defections, triggered = in_the_matrix.GrimTrigger.batched_step(
+        partner_defections, partner_resources, defect_index=0, threshold=2)
+    np.testing.assert_equal(defections, [1, 2, 1, 2])
+    np.testing.assert_equal(triggered, [False, True, False, True])
+
 
 class TitForTatTest(parameterized.TestCase):
 
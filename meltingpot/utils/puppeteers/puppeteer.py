@@ -60,9 +60,12 @@ class Puppeteer(Generic[State], metaclass=abc.ABCMeta):
 def puppet_timestep(timestep: dm_env.TimeStep,
                     goal: PuppetGoal) -> dm_env.TimeStep:
   """Returns a timestep with a goal observation added."""
-  puppet_observation = immutabledict.immutabledict(
-      timestep.observation, **{_GOAL_OBSERVATION_KEY: goal})
-  return timestep._replace(observation=puppet_observation)
+  puppet_observation = {**timestep.observation, _GOAL_OBSERVATION_KEY: goal}
+  return dm_env.TimeStep(
+      step_type=timestep.step_type,
+      reward=timestep.reward,
+      discount=timestep.discount,
+      observation=puppet_observation)
 
 
 def puppet_goals(names: Sequence[str],
@@ -0,0 +1,64 @@
+# Copyright 2022 DeepMind Technologies Limited.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for puppeteer utilities."""
+
+from unittest import mock
+
+from absl.testing import absltest
+import dm_env
+from meltingpot.utils.puppeteers import puppeteer
+import numpy as np
+
+_GOAL_KEY = puppeteer._GOAL_OBSERVATION_KEY  # pylint: disable=protected-access
+
+
+class PuppetTimestepTest(absltest.TestCase):
+
+  def test_adds_goal_observation(self):
+    timestep = dm_env.restart({'a': mock.sentinel.a})
+    actual = puppeteer.puppet_timestep(timestep, mock.sentinel.goal)
+    expected = dm_env.restart(
+        {'a': mock.sentinel.a, _GOAL_KEY: mock.sentinel.goal})
+    self.assertEqual(actual, expected)
+
+  def test_does_not_mutate_original_observation(self):
+    observation = {'a': mock.sentinel.a}
+    timestep = dm_env.restart(observation)
+    puppeteer.puppet_timestep(timestep, mock.sentinel.goal)
+    self.assertEqual(observation, {'a': mock.sentinel.a})
+
+
+class PuppetGoalsTest(absltest.TestCase):
+
+  def test_goals_are_one_hot(self):
+    goals = puppeteer.puppet_goals(['A', 'B', 'C'])
+    np.testing.assert_equal(goals['A'], [1, 0, 0])
+    np.testing.assert_equal(goals['B'], [0, 1, 0])
+    np.testing.assert_equal(goals['C'], [0, 0, 1])
+
+  def test_goals_share_a_single_buffer(self):
+    goals = puppeteer.puppet_goals(['A', 'B', 'C'])
+    bases = {id(goal.base) for goal in goals.values()}
+    self.assertLen(bases, 1)
+    for goal in goals.values():
+      self.assertIsNotNone(goal.base)
+
+  def test_goals_are_readonly(self):
+    goals = puppeteer.puppet_goals(['A', 'B'])
+    with self.assertRaises(ValueError):
+      goals['A'][0] = 0
+
+
+if __name__ == '__main__':
+  absltest.main()